@@ -10,25 +10,42 @@ from datarepo.core import (
 import pyarrow as pa
 import polars as pl
 
+# Arrow types shared by all schemas below, also used by generate_tpc_site.py
+I64 = pa.int64()
+STR = pa.string()
+DATE32 = pa.date32()
+F32 = pa.float32()
+F64 = pa.float64()
+
+# Address columns shared by several tables, without their table prefix. Also used by
+# generate_tpc_site.py for its mocked schemas.
+ADDRESS_COLUMNS = (
+    ("street_number", STR),
+    ("street_name", STR),
+    ("street_type", STR),
+    ("suite_number", STR),
+    ("city", STR),
+    ("county", STR),
+    ("state", STR),
+    ("zip", STR),
+    ("country", STR),
+    ("gmt_offset", F32),
+)
+
+def address_columns(prefix: str) -> list[tuple[str, pa.DataType]]:
+    """Address columns of a table, named with the table's column prefix."""
+    return [(f"{prefix}{name}", type_) for name, type_ in ADDRESS_COLUMNS]
+
 # Define tables
 customer_address = DeltalakeTable(
     name="customer_address",
     uri="s3://my-bucket/tpc-ds/customer_address",
     schema=pa.schema(
         [
-            ("ca_address_sk", pa.int64()),
-            ("ca_address_id", pa.string()),
-            ("ca_street_number", pa.string()),
-            ("ca_street_name", pa.string()),
-            ("ca_street_type", pa.string()),
-            ("ca_suite_number", pa.string()),
-            ("ca_city", pa.string()),
-            ("ca_county", pa.string()),
-            ("ca_state", pa.string()),
-            ("ca_zip", pa.string()),
-            ("ca_country", pa.string()),
-            ("ca_gmt_offset", pa.float32()),
-            ("ca_location_type", pa.string()),
+            ("ca_address_sk", I64),
+            ("ca_address_id", STR),
+            *address_columns("ca_"),
+            ("ca_location_type", STR),
         ]
     ),
     docs_filters=[
@@ -52,15 +69,15 @@ customer_demographics = DeltalakeTable(
     uri="s3://my-bucket/tpc-ds/customer_demographics",
     schema=pa.schema(
         [
-            ("cd_demo_sk", pa.int64()),
-            ("cd_gender", pa.string()),
-            ("cd_marital_status", pa.string()),
-            ("cd_education_status", pa.string()),
-            ("cd_purchase_estimate", pa.int64()),
-            ("cd_credit_rating", pa.string()),
-            ("cd_dep_count", pa.int64()),
-            ("cd_dep_employed_count", pa.int64()),
-            ("cd_dep_college_count", pa.int64()),
+            ("cd_demo_sk", I64),
+            ("cd_gender", STR),
+            ("cd_marital_status", STR),
+            ("cd_education_status", STR),
+            ("cd_purchase_estimate", I64),
+            ("cd_credit_rating", STR),
+            ("cd_dep_count", I64),
+            ("cd_dep_employed_count", I64),
+            ("cd_dep_college_count", I64),
         ]
     ),
     docs_filters=[
@@ -84,34 +101,34 @@ date_dim = DeltalakeTable(
     uri="s3://my-bucket/tpc-ds/date_dim",
     schema=pa.schema(
         [
-            ("d_date_sk", pa.int64()),
-            ("d_date_id", pa.string()),
-            ("d_date", pa.date32()),
-            ("d_month_seq", pa.int64()),
-            ("d_week_seq", pa.int64()),
-            ("d_quarter_seq", pa.int64()),
-            ("d_year", pa.int64()),
-            ("d_dow", pa.int64()),
-            ("d_moy", pa.int64()),
-            ("d_dom", pa.int64()),
-            ("d_qoy", pa.int64()),
-            ("d_fy_year", pa.int64()),
-            ("d_fy_quarter_seq", pa.int64()),
-            ("d_fy_week_seq", pa.int64()),
-            ("d_day_name", pa.string()),
-            ("d_quarter_name", pa.string()),
-            ("d_holiday", pa.string()),
-            ("d_weekend", pa.string()),
-            ("d_following_holiday", pa.string()),
-            ("d_first_dom", pa.int64()),
-            ("d_last_dom", pa.int64()),
-            ("d_same_day_ly", pa.int64()),
-            ("d_same_day_lq", pa.int64()),
-            ("d_current_day", pa.string()),
-            ("d_current_week", pa.string()),
-            ("d_current_month", pa.string()),
-            ("d_current_quarter", pa.string()),
-            ("d_current_year", pa.string()),
+            ("d_date_sk", I64),
+            ("d_date_id", STR),
+            ("d_date", DATE32),
+            ("d_month_seq", I64),
+            ("d_week_seq", I64),
+            ("d_quarter_seq", I64),
+            ("d_year", I64),
+            ("d_dow", I64),
+            ("d_moy", I64),
+            ("d_dom", I64),
+            ("d_qoy", I64),
+            ("d_fy_year", I64),
+            ("d_fy_quarter_seq", I64),
+            ("d_fy_week_seq", I64),
+            ("d_day_name", STR),
+            ("d_quarter_name", STR),
+            ("d_holiday", STR),
+            ("d_weekend", STR),
+            ("d_following_holiday", STR),
+            ("d_first_dom", I64),
+            ("d_last_dom", I64),
+            ("d_same_day_ly", I64),
+            ("d_same_day_lq", I64),
+            ("d_current_day", STR),
+            ("d_current_week", STR),
+            ("d_current_month", STR),
+            ("d_current_quarter", STR),
+            ("d_current_year", STR),
         ]
     ),
     docs_filters=[
@@ -130,13 +147,8 @@ date_dim = DeltalakeTable(
     },
 )
 
-@table(
-    data_input="Warehouse master data from logistics system <code>/api/warehouses/master</code> endpoint",
-    latency_info="Updated daily by the warehouse_master_sync DAG on Airflow",
-)
-def warehouse() -> NlkDataFrame:
-    """Warehouse information from the TPC-DS benchmark."""
-    data = {
+_WAREHOUSE_DF = pl.DataFrame(
+    {
         "w_warehouse_sk": [1, 2, 3, 4, 5],
         "w_warehouse_id": [
             "WAREHOUSE_1",
@@ -164,7 +176,15 @@ def warehouse() -> NlkDataFrame:
         "w_country": ["United States", "United States", "United States", "United States", "United States"],
         "w_gmt_offset": [-6.0, -6.0, -5.0, -5.0, -8.0],
     }
-    return NlkDataFrame(data)
+)
+
+@table(
+    data_input="Warehouse master data from logistics system <code>/api/warehouses/master</code> endpoint",
+    latency_info="Updated daily by the warehouse_master_sync DAG on Airflow",
+)
+def warehouse() -> NlkDataFrame:
+    """Warehouse information from the TPC-DS benchmark."""
+    return _WAREHOUSE_DF.lazy()
 
 ship_mode = ParquetTable(
     name="ship_mode",
@@ -193,16 +213,16 @@ time_dim = DeltalakeTable(
     uri="s3://my-bucket/tpc-ds/time_dim",
     schema=pa.schema(
         [
-            ("t_time_sk", pa.int64()),
-            ("t_time_id", pa.string()),
-            ("t_time", pa.int64()),
-            ("t_hour", pa.int64()),
-            ("t_minute", pa.int64()),
-            ("t_second", pa.int64()),
-            ("t_am_pm", pa.string()),
-            ("t_shift", pa.string()),
-            ("t_sub_shift", pa.string()),
-            ("t_meal_time", pa.string()),
+            ("t_time_sk", I64),
+            ("t_time_id", STR),
+            ("t_time", I64),
+            ("t_hour", I64),
+            ("t_minute", I64),
+            ("t_second", I64),
+            ("t_am_pm", STR),
+            ("t_shift", STR),
+            ("t_sub_shift", STR),
+            ("t_meal_time", STR),
         ]
     ),
     docs_filters=[
@@ -221,13 +241,8 @@ time_dim = DeltalakeTable(
     },
 )
 
-@table(
-    data_input="Return reason codes from customer service system <code>/api/returns/reasons</code> endpoint",
-    latency_info="Updated monthly by the customer_service_sync DAG on Airflow",
-)
-def reason() -> NlkDataFrame:
-    """Return reason information from the TPC-DS benchmark."""
-    data = {
+_REASON_DF = pl.DataFrame(
+    {
         "r_reason_sk": [1, 2, 3, 4, 5],
         "r_reason_id": ["REASON_1", "REASON_2", "REASON_3", "REASON_4", "REASON_5"],
         "r_reason_desc": [
@@ -238,48 +253,59 @@ def reason() -> NlkDataFrame:
             "Item not as described",
         ],
     }
-    return NlkDataFrame(data)
+)
 
 @table(
-    data_input="Income band definitions from market research system <code>/api/demographics/income_bands</code> endpoint",
-    latency_info="Updated annually by the demographics_sync DAG on Airflow",
+    data_input="Return reason codes from customer service system <code>/api/returns/reasons</code> endpoint",
+    latency_info="Updated monthly by the customer_service_sync DAG on Airflow",
 )
-def income_band() -> NlkDataFrame:
-    """Income band information from the TPC-DS benchmark."""
-    data = {
+def reason() -> NlkDataFrame:
+    """Return reason information from the TPC-DS benchmark."""
+    return _REASON_DF.lazy()
+
+_INCOME_BAND_DF = pl.DataFrame(
+    {
         "ib_income_band_sk": [1, 2, 3, 4, 5],
         "ib_lower_bound": [0, 15000, 30000, 50000, 75000],
         "ib_upper_bound": [14999, 29999, 49999, 74999, 100000],
     }
-    return NlkDataFrame(data)
+)
+
+@table(
+    data_input="Income band definitions from market research system <code>/api/demographics/income_bands</code> endpoint",
+    latency_info="Updated annually by the demographics_sync DAG on Airflow",
+)
+def income_band() -> NlkDataFrame:
+    """Income band information from the TPC-DS benchmark."""
+    return _INCOME_BAND_DF.lazy()
 
 item = DeltalakeTable(
     name="item",
     uri="s3://my-bucket/tpc-ds/item",
     schema=pa.schema(
         [
-            ("i_item_sk", pa.int64()),
-            ("i_item_id", pa.string()),
-            ("i_rec_start_date", pa.date32()),
-            ("i_rec_end_date", pa.date32()),
-            ("i_item_desc", pa.string()),
-            ("i_current_price", pa.float32()),
-            ("i_wholesale_cost", pa.float32()),
-            ("i_brand_id", pa.int64()),
-            ("i_brand", pa.string()),
-            ("i_class_id", pa.int64()),
-            ("i_class", pa.string()),
-            ("i_category_id", pa.int64()),
-            ("i_category", pa.string()),
-            ("i_manufact_id", pa.int64()),
-            ("i_manufact", pa.string()),
-            ("i_size", pa.string()),
-            ("i_formulation", pa.string()),
-            ("i_color", pa.string()),
-            ("i_units", pa.string()),
-            ("i_container", pa.string()),
-            ("i_manager_id", pa.int64()),
-            ("i_product_name", pa.string()),
+            ("i_item_sk", I64),
+            ("i_item_id", STR),
+            ("i_rec_start_date", DATE32),
+            ("i_rec_end_date", DATE32),
+            ("i_item_desc", STR),
+            ("i_current_price", F32),
+            ("i_wholesale_cost", F32),
+            ("i_brand_id", I64),
+            ("i_brand", STR),
+            ("i_class_id", I64),
+            ("i_class", STR),
+            ("i_category_id", I64),
+            ("i_category", STR),
+            ("i_manufact_id", I64),
+            ("i_manufact", STR),
+            ("i_size", STR),
+            ("i_formulation", STR),
+            ("i_color", STR),
+            ("i_units", STR),
+            ("i_container", STR),
+            ("i_manager_id", I64),
+            ("i_product_name", STR),
         ]
     ),
     docs_filters=[
@@ -303,35 +329,26 @@ store = DeltalakeTable(
     uri="s3://my-bucket/tpc-ds/store",
     schema=pa.schema(
         [
-            ("s_store_sk", pa.int64()),
-            ("s_store_id", pa.string()),
-            ("s_rec_start_date", pa.date32()),
-            ("s_rec_end_date", pa.date32()),
-            ("s_closed_date_sk", pa.int64()),
-            ("s_store_name", pa.string()),
-            ("s_number_employees", pa.int64()),
-            ("s_floor_space", pa.int64()),
-            ("s_hours", pa.string()),
-            ("s_manager", pa.string()),
-            ("s_market_id", pa.int64()),
-            ("s_geography_class", pa.string()),
-            ("s_market_desc", pa.string()),
-            ("s_market_manager", pa.string()),
-            ("s_division_id", pa.int64()),
-            ("s_division_name", pa.string()),
-            ("s_company_id", pa.int64()),
-            ("s_company_name", pa.string()),
-            ("s_street_number", pa.string()),
-            ("s_street_name", pa.string()),
-            ("s_street_type", pa.string()),
-            ("s_suite_number", pa.string()),
-            ("s_city", pa.string()),
-            ("s_county", pa.string()),
-            ("s_state", pa.string()),
-            ("s_zip", pa.string()),
-            ("s_country", pa.string()),
-            ("s_gmt_offset", pa.float32()),
-            ("s_tax_precentage", pa.float32()),
+            ("s_store_sk", I64),
+            ("s_store_id", STR),
+            ("s_rec_start_date", DATE32),
+            ("s_rec_end_date", DATE32),
+            ("s_closed_date_sk", I64),
+            ("s_store_name", STR),
+            ("s_number_employees", I64),
+            ("s_floor_space", I64),
+            ("s_hours", STR),
+            ("s_manager", STR),
+            ("s_market_id", I64),
+            ("s_geography_class", STR),
+            ("s_market_desc", STR),
+            ("s_market_manager", STR),
+            ("s_division_id", I64),
+            ("s_division_name", STR),
+            ("s_company_id", I64),
+            ("s_company_name", STR),
+            *address_columns("s_"),
+            ("s_tax_precentage", F32),
         ]
     ),
     docs_filters=[
@@ -355,37 +372,28 @@ call_center = DeltalakeTable(
     uri="s3://my-bucket/tpc-ds/call_center",
     schema=pa.schema(
         [
-            ("cc_call_center_sk", pa.int64()),
-            ("cc_call_center_id", pa.string()),
-            ("cc_rec_start_date", pa.date32()),
-            ("cc_rec_end_date", pa.date32()),
-            ("cc_closed_date_sk", pa.int64()),
-            ("cc_open_date_sk", pa.int64()),
-            ("cc_name", pa.string()),
-            ("cc_class", pa.string()),
-            ("cc_employees", pa.int64()),
-            ("cc_sq_ft", pa.int64()),
-            ("cc_hours", pa.string()),
-            ("cc_manager", pa.string()),
-            ("cc_mkt_id", pa.int64()),
-            ("cc_mkt_class", pa.string()),
-            ("cc_mkt_desc", pa.string()),
-            ("cc_market_manager", pa.string()),
-            ("cc_division", pa.int64()),
-            ("cc_division_name", pa.string()),
-            ("cc_company", pa.int64()),
-            ("cc_company_name", pa.string()),
-            ("cc_street_number", pa.string()),
-            ("cc_street_name", pa.string()),
-            ("cc_street_type", pa.string()),
-            ("cc_suite_number", pa.string()),
-            ("cc_city", pa.string()),
-            ("cc_county", pa.string()),
-            ("cc_state", pa.string()),
-            ("cc_zip", pa.string()),
-            ("cc_country", pa.string()),
-            ("cc_gmt_offset", pa.float32()),
-            ("cc_tax_percentage", pa.float32()),
+            ("cc_call_center_sk", I64),
+            ("cc_call_center_id", STR),
+            ("cc_rec_start_date", DATE32),
+            ("cc_rec_end_date", DATE32),
+            ("cc_closed_date_sk", I64),
+            ("cc_open_date_sk", I64),
+            ("cc_name", STR),
+            ("cc_class", STR),
+            ("cc_employees", I64),
+            ("cc_sq_ft", I64),
+            ("cc_hours", STR),
+            ("cc_manager", STR),
+            ("cc_mkt_id", I64),
+            ("cc_mkt_class", STR),
+            ("cc_mkt_desc", STR),
+            ("cc_market_manager", STR),
+            ("cc_division", I64),
+            ("cc_division_name", STR),
+            ("cc_company", I64),
+            ("cc_company_name", STR),
+            *address_columns("cc_"),
+            ("cc_tax_percentage", F32),
         ]
     ),
     docs_filters=[
@@ -404,13 +412,8 @@ call_center = DeltalakeTable(
     },
 )
 
-@table(
-    data_input="Customer profile data from CRM system <code>/api/customers/profiles</code> endpoint",
-    latency_info="Updated daily by the customer_profile_sync DAG on Airflow",
-)
-def customer() -> NlkDataFrame:
-    """Customer information from the TPC-DS benchmark."""
-    data = {
+_CUSTOMER_DF = pl.DataFrame(
+    {
         "c_customer_sk": [1, 2, 3, 4, 5],
         "c_customer_id": [
             "CUSTOMER_1",
@@ -436,39 +439,38 @@ def customer() -> NlkDataFrame:
         "c_email_address": ["john@email.com", "jane@email.com", "bob@email.com", "alice@email.com", "charlie@email.com"],
         "c_last_review_date": ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"],
     }
-    return NlkDataFrame(data)
+)
+
+@table(
+    data_input="Customer profile data from CRM system <code>/api/customers/profiles</code> endpoint",
+    latency_info="Updated daily by the customer_profile_sync DAG on Airflow",
+)
+def customer() -> NlkDataFrame:
+    """Customer information from the TPC-DS benchmark."""
+    return _CUSTOMER_DF.lazy()
 
 web_site = DeltalakeTable(
     name="web_site",
     uri="s3://my-bucket/tpc-ds/web_site",
     schema=pa.schema(
         [
-            ("web_site_sk", pa.int64()),
-            ("web_site_id", pa.string()),
-            ("web_rec_start_date", pa.date32()),
-            ("web_rec_end_date", pa.date32()),
-            ("web_name", pa.string()),
-            ("web_open_date_sk", pa.int64()),
-            ("web_close_date_sk", pa.int64()),
-            ("web_class", pa.string()),
-            ("web_manager", pa.string()),
-            ("web_mkt_id", pa.int64()),
-            ("web_mkt_class", pa.string()),
-            ("web_mkt_desc", pa.string()),
-            ("web_market_manager", pa.string()),
-            ("web_company_id", pa.int64()),
-            ("web_company_name", pa.string()),
-            ("web_street_number", pa.string()),
-            ("web_street_name", pa.string()),
-            ("web_street_type", pa.string()),
-            ("web_suite_number", pa.string()),
-            ("web_city", pa.string()),
-            ("web_county", pa.string()),
-            ("web_state", pa.string()),
-            ("web_zip", pa.string()),
-            ("web_country", pa.string()),
-            ("web_gmt_offset", pa.float32()),
-            ("web_tax_percentage", pa.float32()),
+            ("web_site_sk", I64),
+            ("web_site_id", STR),
+            ("web_rec_start_date", DATE32),
+            ("web_rec_end_date", DATE32),
+            ("web_name", STR),
+            ("web_open_date_sk", I64),
+            ("web_close_date_sk", I64),
+            ("web_class", STR),
+            ("web_manager", STR),
+            ("web_mkt_id", I64),
+            ("web_mkt_class", STR),
+            ("web_mkt_desc", STR),
+            ("web_market_manager", STR),
+            ("web_company_id", I64),
+            ("web_company_name", STR),
+            *address_columns("web_"),
+            ("web_tax_percentage", F32),
         ]
     ),
     docs_filters=[
@@ -510,40 +512,43 @@ store_returns = ParquetTable(
     },
 )
 
-@table(
-    data_input="Household demographic data from market research system <code>/api/demographics/households</code> endpoint",
-    latency_info="Updated quarterly by the demographics_sync DAG on Airflow",
-)
-def household_demographics() -> NlkDataFrame:
-    """Household demographics information from the TPC-DS benchmark."""
-    data = {
+_HOUSEHOLD_DEMOGRAPHICS_DF = pl.DataFrame(
+    {
         "hd_demo_sk": [1, 2, 3, 4, 5],
         "hd_income_band_sk": [1, 2, 3, 4, 5],
         "hd_buy_potential": ["HIGH", "MEDIUM", "LOW", "UNKNOWN", "HIGH"],
         "hd_dep_count": [2, 0, 3, 1, 4],
         "hd_vehicle_count": [1, 2, 2, 0, 3],
     }
-    return NlkDataFrame(data)
+)
+
+@table(
+    data_input="Household demographic data from market research system <code>/api/demographics/households</code> endpoint",
+    latency_info="Updated quarterly by the demographics_sync DAG on Airflow",
+)
+def household_demographics() -> NlkDataFrame:
+    """Household demographics information from the TPC-DS benchmark."""
+    return _HOUSEHOLD_DEMOGRAPHICS_DF.lazy()
 
 web_page = DeltalakeTable(
     name="web_page",
     uri="s3://my-bucket/tpc-ds/web_page",
     schema=pa.schema(
         [
-            ("wp_web_page_sk", pa.int64()),
-            ("wp_web_page_id", pa.string()),
-            ("wp_rec_start_date", pa.date32()),
-            ("wp_rec_end_date", pa.date32()),
-            ("wp_creation_date_sk", pa.int64()),
-            ("wp_access_date_sk", pa.int64()),
-            ("wp_autogen_flag", pa.string()),
-            ("wp_customer_sk", pa.int64()),
-            ("wp_url", pa.string()),
-            ("wp_type", pa.string()),
-            ("wp_char_count", pa.int64()),
-            ("wp_link_count", pa.int64()),
-            ("wp_image_count", pa.int64()),
-            ("wp_max_ad_count", pa.int64()),
+            ("wp_web_page_sk", I64),
+            ("wp_web_page_id", STR),
+            ("wp_rec_start_date", DATE32),
+            ("wp_rec_end_date", DATE32),
+            ("wp_creation_date_sk", I64),
+            ("wp_access_date_sk", I64),
+            ("wp_autogen_flag", STR),
+            ("wp_customer_sk", I64),
+            ("wp_url", STR),
+            ("wp_type", STR),
+            ("wp_char_count", I64),
+            ("wp_link_count", I64),
+            ("wp_image_count", I64),
+            ("wp_max_ad_count", I64),
         ]
     ),
     docs_filters=[
@@ -567,25 +572,25 @@ promotion = DeltalakeTable(
     uri="s3://my-bucket/tpc-ds/promotion",
     schema=pa.schema(
         [
-            ("p_promo_sk", pa.int64()),
-            ("p_promo_id", pa.string()),
-            ("p_start_date_sk", pa.int64()),
-            ("p_end_date_sk", pa.int64()),
-            ("p_item_sk", pa.int64()),
-            ("p_cost", pa.float64()),
-            ("p_response_target", pa.int64()),
-            ("p_promo_name", pa.string()),
-            ("p_channel_dmail", pa.string()),
-            ("p_channel_email", pa.string()),
-            ("p_channel_catalog", pa.string()),
-            ("p_channel_tv", pa.string()),
-            ("p_channel_radio", pa.string()),
-            ("p_channel_press", pa.string()),
-            ("p_channel_event", pa.string()),
-            ("p_channel_demo", pa.string()),
-            ("p_channel_details", pa.string()),
-            ("p_purpose", pa.string()),
-            ("p_discount_active", pa.string()),
+            ("p_promo_sk", I64),
+            ("p_promo_id", STR),
+            ("p_start_date_sk", I64),
+            ("p_end_date_sk", I64),
+            ("p_item_sk", I64),
+            ("p_cost", F64),
+            ("p_response_target", I64),
+            ("p_promo_name", STR),
+            ("p_channel_dmail", STR),
+            ("p_channel_email", STR),
+            ("p_channel_catalog", STR),
+            ("p_channel_tv", STR),
+            ("p_channel_radio", STR),
+            ("p_channel_press", STR),
+            ("p_channel_event", STR),
+            ("p_channel_demo", STR),
+            ("p_channel_details", STR),
+            ("p_purpose", STR),
+            ("p_discount_active", STR),
         ]
     ),
     docs_filters=[
@@ -609,15 +614,15 @@ catalog_page = DeltalakeTable(
     uri="s3://my-bucket/tpc-ds/catalog_page",
     schema=pa.schema(
         [
-            ("cp_catalog_page_sk", pa.int64()),
-            ("cp_catalog_page_id", pa.string()),
-            ("cp_start_date_sk", pa.int64()),
-            ("cp_end_date_sk", pa.int64()),
-            ("cp_department", pa.string()),
-            ("cp_catalog_number", pa.int64()),
-            ("cp_catalog_page_number", pa.int64()),
-            ("cp_description", pa.string()),
-            ("cp_type", pa.string()),
+            ("cp_catalog_page_sk", I64),
+            ("cp_catalog_page_id", STR),
+            ("cp_start_date_sk", I64),
+            ("cp_end_date_sk", I64),
+            ("cp_department", STR),
+            ("cp_catalog_number", I64),
+            ("cp_catalog_page_number", I64),
+            ("cp_description", STR),
+            ("cp_type", STR),
         ]
     ),
     docs_filters=[
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from types import ModuleType
-from typing import Any, Optional, Protocol, cast
+from typing import Any, Iterator, Optional, Protocol, cast
 import warnings
 
 from datarepo.core.dataframe import NlkDataFrame
@@ -77,10 +77,35 @@ class ModuleDatabase(Database):
         Returns:
             dict[str, TableProtocol]: A dictionary of table names and their corresponding TableProtocol objects.
         """
-        methods = dir(self.db)
+        return dict(self._iter_tables(show_deprecated))
 
-        tables = {}
-        for name in methods:
+    def tables(self, show_deprecated: bool = False) -> list[str]:
+        """Get a list of table names in the database.
+
+        Args:
+            show_deprecated (bool, optional): Whether to include deprecated tables. Defaults to False.
+
+        Returns:
+            list[str]: A list of table names.
+        """
+        # Only the names are needed, so no table dictionary is built
+        return [name for name, _ in self._iter_tables(show_deprecated)]
+
+    def _iter_tables(
+        self, show_deprecated: bool
+    ) -> Iterator[tuple[str, TableProtocol]]:
+        """Iterate over the tables of the module.
+
+        Tables are looked up on every call, so that reloaded or reassigned module
+        attributes are always picked up.
+
+        Args:
+            show_deprecated (bool): Whether to include deprecated tables.
+
+        Yields:
+            tuple[str, TableProtocol]: The name of each table and the table itself.
+        """
+        for name in dir(self.db):
             table = self._get_table(name)
             if table is None:
                 continue
@@ -88,9 +113,7 @@ class ModuleDatabase(Database):
             if table.table_metadata.is_deprecated and not show_deprecated:
                 continue
 
-            tables[name] = table
-
-        return tables
+            yield name, table
 
     def table(self, name: str, *args: Any, **kwargs: Any) -> NlkDataFrame:
         """Get a table from the database.
@@ -129,7 +152,7 @@ class ModuleDatabase(Database):
             TableProtocol | None: The requested table or None if not found.
         """
         table = getattr(self.db, name)
-        if not hasattr(table, "table_metadata"):
+        if getattr(table, "table_metadata", None) is None:
             return None
 
         return cast(TableProtocol, table)
@@ -179,7 +202,8 @@ class DatabaseWithGlobalArgs(Database):
         Returns:
             NlkDataFrame: The requested table.
         """
-        new_kwargs = {**self._global_args, **kwargs}
+        # Only merge when needed, the global args are splatted into a new dict by the call anyway
+        new_kwargs = {**self._global_args, **kwargs} if kwargs else self._global_args
         return self.db.table(name, *args, **new_kwargs)
 
 
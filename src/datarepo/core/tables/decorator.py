@@ -26,6 +26,16 @@ class FunctionTable(TableProtocol):
         self.table_metadata = table_metadata
         self.func = func
 
+        # Resolve the signature once, inspecting it on every call is relatively slow
+        parameters = inspect.signature(func).parameters
+        self._param_names = frozenset(parameters)
+        self._accepts_var_kwargs = any(
+            param.kind == inspect.Parameter.VAR_KEYWORD for param in parameters.values()
+        )
+
+        # The schema requires calling the function, and docs_args don't change
+        self._schema_cache: TableSchema | None = None
+
     def __call__(self, *args: Any, **kwargs: dict[str, Any]) -> NlkDataFrame:
         """Call the function and return the result as a NlkDataFrame.
 
@@ -33,15 +43,12 @@ class FunctionTable(TableProtocol):
             NlkDataFrame: The result of the function call in a form of NlkDataFrame.
         """
         # Filter to only include kwargs that are in the function signature
-        parameters = inspect.signature(self.func).parameters
-        accepts_var_kwargs = any(
-            param.kind == inspect.Parameter.VAR_KEYWORD for param in parameters.values()
-        )
-        if not accepts_var_kwargs:
+        if not self._accepts_var_kwargs:
+            param_names = self._param_names
             kwargs = {
                 key: value
                 for key, value in kwargs.items()
-                if key in parameters and key not in args
+                if key in param_names and key not in args
             }
 
         return self.func(*args, **kwargs)
@@ -52,6 +59,9 @@ class FunctionTable(TableProtocol):
         Returns:
             TableSchema: The schema of the table, including partitions and columns.
         """
+        if self._schema_cache is not None:
+            return self._schema_cache
+
         filters = self.table_metadata.docs_args.get("filters", [])
 
         # Infer partitions from filters
@@ -78,7 +88,8 @@ class FunctionTable(TableProtocol):
                 for key, type in fallback_table.collect_schema().items()
             ]
 
-        return TableSchema(partitions=partitions, columns=columns)
+        self._schema_cache = TableSchema(partitions=partitions, columns=columns)
+        return self._schema_cache
 
 
 def table(*args, **kwargs) -> Callable[[U], U] | Callable[[Any], Callable[[U], U]]:
@@ -4,8 +4,11 @@ from __future__ import annotations
 import concurrent.futures
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import functools
 import os
-from typing import Any, TypeAlias
+import threading
+import time
+from typing import Any, Hashable, Iterable, TypeAlias, cast
 import warnings
 
 import boto3
@@ -15,7 +18,11 @@ import polars as pl
 import pyarrow as pa
 
 from datarepo.core.dataframe import NlkDataFrame
-from datarepo.core.tables.filters import InputFilters, normalize_filters
+from datarepo.core.tables.filters import (
+    InputFilters,
+    NormalizedFilters,
+    normalize_filters,
+)
 from datarepo.core.tables.metadata import (
     TableMetadata,
     TableProtocol,
@@ -32,12 +39,25 @@ from datarepo.core.tables.util import (
 )
 
 READ_PARQUET_RETRY_COUNT = 10
+READ_PARQUET_MAX_WORKERS = min(64, 4 * (os.cpu_count() or 1))
+READ_PARQUET_MAX_IN_FLIGHT = 2 * READ_PARQUET_MAX_WORKERS
+SQL_PREDICATE_CACHE_SIZE = 256
+# How long a loaded DeltaTable is reused before its checkpoint is loaded again
+DELTA_TABLE_CACHE_TTL_SECONDS = 300.0
 DEFAULT_TIMEOUT = "150s"
 
 DeltaInputFilters: TypeAlias = InputFilters | str
 
+# Shared across calls to avoid spinning up new threads for every read
+_read_parquet_executor = ThreadPoolExecutor(
+    max_workers=READ_PARQUET_MAX_WORKERS, thread_name_prefix="datarepo-read-parquet"
+)
+
+# Loaded DeltaTables per thread, keyed by uri, storage options and version
+_delta_table_cache = threading.local()
+
 
-@dataclass
+@dataclass(frozen=True)
 class DeltaCacheOptions:
     # Path to the directory where files are cached. This can be the same for all tables
     # since the S3 table prefix is included in the cached paths.
@@ -49,12 +69,9 @@ class DeltaCacheOptions:
     # A reasonable value for a table with frequent updates (e.g. binned spikes) is 30m.
     file_cache_last_checkpoint_valid_duration: str | None = None
 
-    def to_storage_options(self) -> dict[str, Any]:
-        """Convert the cache options to a dictionary of storage options.
-
-        Returns:
-            dict[str, Any]: A dictionary of storage options that can be used with DeltaTable.
-        """
+    @functools.cached_property
+    def _storage_options(self) -> dict[str, Any]:
+        # Built once, since the options are frozen and used on every read
         opts = {
             "file_cache_path": os.path.expanduser(self.file_cache_path),
         }
@@ -64,6 +81,14 @@ class DeltaCacheOptions:
             )
         return opts
 
+    def to_storage_options(self) -> dict[str, Any]:
+        """Convert the cache options to a dictionary of storage options.
+
+        Returns:
+            dict[str, Any]: A dictionary of storage options that can be used with DeltaTable.
+        """
+        return dict(self._storage_options)
+
 
 class DeltalakeTable(TableProtocol):
     """A table that is backed by a Delta Lake table."""
@@ -104,6 +129,20 @@ class DeltalakeTable(TableProtocol):
         self.stats_cols = stats_cols or []
         self.extra_cols = extra_cols or []
 
+        # Derived from the definition above once, so they are not rebuilt on every read
+        self._extra_col_exprs = [expr for expr, _ in self.extra_cols]
+        self._extra_column_names = frozenset(
+            expr.meta.output_name() for expr in self._extra_col_exprs
+        )
+        self._unique_column_names = frozenset(self.unique_columns or ())
+        self._polars_schema = _to_polars_schema(schema)
+        # SQL predicates of previously seen filters, see _sql_predicate. Tables can be
+        # read from several threads, so the cache is only modified under the lock.
+        self._sql_predicate_cache: dict[Hashable, str] = {}
+        self._sql_predicate_lock = threading.Lock()
+        # Schema for the Delta table version it was generated from, see get_schema
+        self._schema_cache: tuple[int, TableSchema] | None = None
+
         self.table_metadata = TableMetadata(
             table_type="DELTA_LAKE",
             description=description,
@@ -118,7 +157,12 @@ class DeltalakeTable(TableProtocol):
         Returns:
             TableSchema: table schema containing partition and column information.
         """
-        dt = self.delta_table()
+        dt = self._cached_delta_table()
+        # Partition columns can only change with a new version of the table
+        version = dt.version()
+        if self._schema_cache is not None and self._schema_cache[0] == version:
+            return self._schema_cache[1]
+
         schema = self.schema
         partition_cols = dt.metadata().partition_columns
         filters = {
@@ -154,10 +198,12 @@ class DeltalakeTable(TableProtocol):
             )
             for expr, expr_type in self.extra_cols
         ]
-        return TableSchema(
+        table_schema = TableSchema(
             partitions=partitions,
             columns=columns,
         )
+        self._schema_cache = (version, table_schema)
+        return table_schema
 
     def __call__(
         self,
@@ -193,7 +239,7 @@ class DeltalakeTable(TableProtocol):
                 **storage_options,
                 **cache_options.to_storage_options(),
             }
-        dt = self.delta_table(storage_options=storage_options)
+        dt = self._cached_delta_table(storage_options=storage_options)
 
         return self.construct_df(dt=dt, filters=filters, columns=columns)
 
@@ -214,33 +260,22 @@ class DeltalakeTable(TableProtocol):
             NlkDataFrame: a dataframe containing the data from the Delta Lake table, filtered and selected according to the provided parameters.
         """
         # Use schema defined on this table, the physical schema in deltalake metadata might be different
-        schema = self.schema
-
-        predicate_str = datafusion_predicate_from_filters(schema, filters)
-
-        # These should not be read because they don't exist in the delta table
-        extra_col_exprs = [expr for expr, _ in self.extra_cols]
-        extra_column_names = set(expr.meta.output_name() for expr in extra_col_exprs)
+        predicate_str = self._sql_predicate(filters)
 
         columns_to_read = None
-        unique_column_names = set(self.unique_columns or [])
         if columns:
+            # Extra columns should not be read because they don't exist in the delta table
             columns_to_read = list(
-                (set(columns) | unique_column_names) - extra_column_names
+                (set(columns) | self._unique_column_names) - self._extra_column_names
             )
 
         # TODO(peter): consider a sql builder for more complex queries?
-        select_cols = (
-            ", ".join([f'"{col}"' for col in columns_to_read])
-            if columns_to_read
-            else "*"
+        query_string = _select_clause(
+            self.name, frozenset(columns_to_read) if columns_to_read else None
         )
-        condition = f"WHERE {predicate_str}" if predicate_str else ""
-        query_string = f"""
-            SELECT {select_cols}
-            FROM "{self.name}"
-            {condition}
-        """
+        if predicate_str:
+            query_string = f"{query_string} WHERE {predicate_str}"
+
         with warnings.catch_warnings():
             # Ignore ExperimentalWarning emitted from QueryBuilder
             warnings.filterwarnings("ignore", category=ExperimentalWarning)
@@ -248,41 +283,72 @@ class DeltalakeTable(TableProtocol):
                 QueryBuilder().register(self.name, dt).execute(query_string).fetchall()
             )
 
-        # Since we might cast unique string columns to categoricals, use a string cache to
-        # improve performance when combining multiple dataframes
-        with pl.StringCache():
-            if batches:
-                frame = pl.from_arrow(batches, rechunk=False)
-                if isinstance(frame, pl.Series):
-                    frame = frame.to_frame()
-                frame = _normalize_df(frame, self.schema, columns=columns_to_read)
+        if batches:
+            frame = pl.from_arrow(batches, rechunk=False)
+            if isinstance(frame, pl.Series):
+                frame = frame.to_frame()
+            frame = _normalize_df(frame, self._polars_schema, columns=columns_to_read)
+        else:
+            # If dataset is empty, the returned dataframe will have no columns
+            frame = _empty_normalized_df(self.schema)
+
+        if self.extra_cols:
+            frame = frame.with_columns(self._extra_col_exprs)
+
+        if self.unique_columns:
+            # Cast unique string columns to categoricals first so rows are deduplicated
+            # on integer codes. Other columns are left alone to avoid casting them twice.
+            curr_schema = frame.schema
+            cat_columns = [
+                col for col in self.unique_columns if curr_schema.get(col) == pl.String
+            ]
+            if cat_columns:
+                # Only the categorical round trip needs the global string cache
+                with pl.StringCache():
+                    frame = (
+                        frame.with_columns(pl.col(cat_columns).cast(pl.Categorical))
+                        .unique(subset=self.unique_columns, maintain_order=True)
+                        .with_columns(pl.col(cat_columns).cast(pl.String))
+                    )
             else:
-                # If dataset is empty, the returned dataframe will have no columns
-                frame = _empty_normalized_df(schema)
-
-            if self.extra_cols:
-                frame = frame.with_columns(extra_col_exprs)
-
-            if self.unique_columns:
-                # Cast unique string columns to categoricals first
-                # In some cases, this reduces peak memory usage up to 50%
-                curr_schema = frame.schema
-                cat_schema = {
-                    col: pl.Categorical
-                    for col in curr_schema
-                    if curr_schema[col] == pl.String
-                }
-                frame = (
-                    frame.cast(cat_schema)  # type: ignore[arg-type]
-                    .unique(subset=self.unique_columns, maintain_order=True)
-                    .cast(curr_schema)  # type: ignore[arg-type]
-                )
+                frame = frame.unique(subset=self.unique_columns, maintain_order=True)
 
         if columns:
             frame = frame.select(columns)
 
         return frame.lazy()
 
+    def _sql_predicate(self, filters: DeltaInputFilters | None) -> str | None:
+        """Convert input filters to a SQL predicate string, reusing previously built predicates.
+
+        Callers tend to pass the same filters over and over again, so the predicates are
+        cached per table, keyed by the filters.
+
+        Args:
+            filters (DeltaInputFilters | None): The filters to apply to the Delta Lake table.
+
+        Returns:
+            str | None: A SQL predicate string, or None if no filters are provided.
+        """
+        if not filters or isinstance(filters, str):
+            return datafusion_predicate_from_filters(self.schema, filters)
+
+        normalized_filters = normalize_filters(filters)
+        cache_key = _filters_cache_key(normalized_filters)
+        if cache_key is None:
+            return filters_to_sql_predicate(self.schema, normalized_filters)
+
+        predicate = self._sql_predicate_cache.get(cache_key)
+        if predicate is None:
+            predicate = filters_to_sql_predicate(self.schema, normalized_filters)
+            with self._sql_predicate_lock:
+                if len(self._sql_predicate_cache) >= SQL_PREDICATE_CACHE_SIZE:
+                    # Evict the oldest entry
+                    del self._sql_predicate_cache[next(iter(self._sql_predicate_cache))]
+                self._sql_predicate_cache[cache_key] = predicate
+
+        return predicate
+
     def delta_table(
         self, storage_options: dict[str, Any] | None = None, version: int | None = None
     ) -> DeltaTable:
@@ -299,6 +365,82 @@ class DeltalakeTable(TableProtocol):
             table_uri=self.uri, storage_options=storage_options, version=version
         )
 
+    def _cached_delta_table(
+        self, storage_options: dict[str, Any] | None = None, version: int | None = None
+    ) -> DeltaTable:
+        """Get a DeltaTable object for this table that is reused across reads.
+
+        Unlike delta_table, the returned object is shared by later reads in the same
+        thread, so it is only used internally and must not be mutated, e.g. with
+        load_as_version.
+
+        Args:
+            storage_options (dict[str, Any] | None, optional): Storage options for the DeltaTable, such as S3 access credentials. Defaults to None.
+            version (int | None, optional): Version of the Delta table to read. If None, the latest version is used. Defaults to None.
+
+        Returns:
+            DeltaTable: The DeltaTable object representing the Delta Lake table.
+        """
+        cache_key = _delta_table_cache_key(self.uri, storage_options, version)
+        if cache_key is None:
+            return self.delta_table(storage_options=storage_options, version=version)
+
+        cache = _thread_delta_table_cache()
+        now = time.monotonic()
+        cached = cache.get(cache_key)
+        if cached is not None and now - cached[1] < DELTA_TABLE_CACHE_TTL_SECONDS:
+            dt = cached[0]
+            if version is None:
+                # Only load the log entries committed since the table was last loaded,
+                # instead of fetching _last_checkpoint and the checkpoint again
+                dt.update_incremental()
+            return dt
+
+        # Drop expired entries, e.g. for storage options with rotated credentials
+        for key, (_, loaded_at) in list(cache.items()):
+            if now - loaded_at >= DELTA_TABLE_CACHE_TTL_SECONDS:
+                del cache[key]
+
+        dt = self.delta_table(storage_options=storage_options, version=version)
+        cache[cache_key] = (dt, now)
+        return dt
+
+
+def _thread_delta_table_cache() -> dict[Hashable, tuple[DeltaTable, float]]:
+    """Get the DeltaTable cache of the current thread.
+
+    DeltaTable objects are not safe to update while another thread reads them,
+    so each thread keeps its own instances.
+
+    Returns:
+        dict[Hashable, tuple[DeltaTable, float]]: Loaded tables and the time they were loaded at.
+    """
+    if not hasattr(_delta_table_cache, "tables"):
+        _delta_table_cache.tables = {}
+    return _delta_table_cache.tables
+
+
+def _delta_table_cache_key(
+    uri: str, storage_options: dict[str, Any] | None, version: int | None
+) -> Hashable | None:
+    """Build the key of a DeltaTable in the DeltaTable cache.
+
+    Args:
+        uri (str): uri of the table.
+        storage_options (dict[str, Any] | None): storage options the table is loaded with.
+        version (int | None): version of the table, or None for the latest version.
+
+    Returns:
+        Hashable | None: The cache key, or None if the storage options are not hashable.
+    """
+    key = (uri, tuple(sorted((storage_options or {}).items())), version)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
 
 def fetch_df_by_partition(
     dt: DeltaTable,
@@ -355,23 +497,62 @@ def fetch_dfs_by_paths(
     Returns:
         pl.DataFrame: A Polars DataFrame containing the concatenated results of all Parquet files, normalized to the specified schema.
     """
-    with ThreadPoolExecutor() as executor:
-        futures = [
-            executor.submit(
-                pl.read_parquet,
-                file,
-                retries=READ_PARQUET_RETRY_COUNT,
-                storage_options=storage_options,
-                # Hive partitioning was disabled by default in https://github.com/pola-rs/polars/pull/17106
-                hive_partitioning=True,
+    # Resolve the polars schema once rather than once per file
+    polars_schema = _to_polars_schema(schema)
+
+    dfs: list[pl.DataFrame | None] = [None] * len(files)
+    pending: dict[concurrent.futures.Future[pl.DataFrame], int] = {}
+
+    def collect(futures: Iterable[concurrent.futures.Future[pl.DataFrame]]) -> None:
+        for future in futures:
+            dfs[pending.pop(future)] = future.result()
+
+    for i, file in enumerate(files):
+        # Bound the number of queued reads so that large file lists don't pin memory
+        if len(pending) >= READ_PARQUET_MAX_IN_FLIGHT:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
             )
-            for file in files
-        ]
-        concurrent.futures.wait(futures)
+            collect(done)
 
-    dfs = [future.result() for future in futures]
+        future = _read_parquet_executor.submit(
+            _read_normalized_parquet,
+            file,
+            polars_schema=polars_schema,
+            storage_options=storage_options,
+        )
+        pending[future] = i
+
+    collect(concurrent.futures.as_completed(list(pending)))
 
-    return pl.concat([_normalize_df(df, schema=schema) for df in dfs])
+    return pl.concat(cast(list[pl.DataFrame], dfs))
+
+
+def _read_normalized_parquet(
+    file: str,
+    polars_schema: pl.Schema,
+    storage_options: dict[str, Any] | None = None,
+) -> pl.DataFrame:
+    """Read a single Parquet file and normalize it to the given schema.
+
+    Normalization happens in the reading thread, so that it runs in parallel across files.
+
+    Args:
+        file (str): Path of the Parquet file to read.
+        polars_schema (pl.Schema): Schema to normalize the dataframe to.
+        storage_options (dict[str, Any] | None, optional): Storage options for reading the Parquet file. Defaults to None.
+
+    Returns:
+        pl.DataFrame: The contents of the Parquet file, normalized to the specified schema.
+    """
+    df = pl.read_parquet(
+        file,
+        retries=READ_PARQUET_RETRY_COUNT,
+        storage_options=storage_options,
+        # Hive partitioning was disabled by default in https://github.com/pola-rs/polars/pull/17106
+        hive_partitioning=True,
+    )
+    return _normalize_df(df, schema=polars_schema)
 
 
 def _empty_normalized_df(schema: pa.Schema) -> pl.DataFrame:
@@ -383,12 +564,16 @@ def _empty_normalized_df(schema: pa.Schema) -> pl.DataFrame:
     Returns:
         pl.DataFrame: An empty DataFrame with the specified schema.
     """
-    return _normalize_df(pl.DataFrame({col: [] for col in schema.names}), schema=schema)
+    # The empty Arrow table already has the right types, so no normalization is needed
+    frame = pl.from_arrow(schema.empty_table())
+    if isinstance(frame, pl.Series):
+        frame = frame.to_frame()
+    return frame
 
 
 def _normalize_df(
     df: pl.DataFrame,
-    schema: pa.Schema,
+    schema: pa.Schema | pl.Schema,
     columns: list[str] | None = None,
 ) -> pl.DataFrame:
     """Add missing columns, cast, and reorder dataframe columns to the specified schema's order.
@@ -397,16 +582,16 @@ def _normalize_df(
 
     Args:
         df (pl.DataFrame): dataframe to normalize.
-        schema (pa.Schema): schema to normalize the dataframe to.
+        schema (pa.Schema | pl.Schema): schema to normalize the dataframe to. Pass a polars schema
+            when normalizing many dataframes to avoid converting the Arrow schema each time.
         columns (list[str] | None, optional): List of columns to include in the normalized dataframe. If None, all columns from the schema are included. Defaults to None.
 
     Returns:
         pl.DataFrame: A DataFrame normalized to the specified schema, with missing columns added and columns reordered.
     """
-    empty_frame = pl.from_arrow(schema.empty_table())
-    if isinstance(empty_frame, pl.Series):
-        empty_frame = empty_frame.to_frame()
-    polars_schema = empty_frame.schema
+    polars_schema = (
+        _to_polars_schema(schema) if isinstance(schema, pa.Schema) else schema
+    )
     if columns:
         # Only add back specified columns
         polars_schema = pl.Schema(
@@ -414,14 +599,87 @@ def _normalize_df(
         )
 
     schema_columns = list(polars_schema.keys())
-    missing_columns = set(schema_columns) - set(df.columns)
-    return (
-        df.with_columns(pl.lit(None).alias(col) for col in missing_columns)
-        .with_columns([pl.col(col).cast(dtype) for col, dtype in polars_schema.items()])
-        .select(schema_columns)
+    df_schema = df.schema
+    if all(df_schema.get(col) == dtype for col, dtype in polars_schema.items()):
+        # Common case of well-typed data, nothing to add or cast
+        if df_schema.names() == schema_columns:
+            return df
+        return df.select(schema_columns)
+
+    # Add missing columns, cast and reorder in a single projection
+    return df.select(
+        (
+            pl.col(col).cast(dtype)
+            if col in df_schema
+            else pl.lit(None, dtype=dtype).alias(col)
+        )
+        for col, dtype in polars_schema.items()
     )
 
 
+@functools.lru_cache(maxsize=128)
+def _to_polars_schema(schema: pa.Schema) -> pl.Schema:
+    """Convert an Arrow schema to the equivalent polars schema.
+
+    The conversion goes through an empty table, which is relatively slow for wide schemas,
+    so results are cached. The returned schema is shared and must not be modified.
+
+    Args:
+        schema (pa.Schema): The Arrow schema to convert.
+
+    Returns:
+        pl.Schema: The equivalent polars schema.
+    """
+    return _empty_normalized_df(schema).schema
+
+
+def _filters_cache_key(filters: NormalizedFilters) -> Hashable | None:
+    """Build a hashable key identifying the given filters.
+
+    Value types are part of the key, since e.g. 1 and True compare equal but are
+    rendered differently in SQL.
+
+    Args:
+        filters (NormalizedFilters): The filters to build a key for.
+
+    Returns:
+        Hashable | None: The key, or None if a filter value is not hashable.
+    """
+
+    def value_key(value: Any) -> Hashable:
+        if isinstance(value, list | tuple):
+            return tuple(value_key(element) for element in value)
+        return (type(value), value)
+
+    key = tuple(
+        tuple((f.column, f.operator, value_key(f.value)) for f in filter_set)
+        for filter_set in filters
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+@functools.lru_cache(maxsize=64)
+def _select_clause(table_name: str, columns: frozenset[str] | None) -> str:
+    """Build the SELECT ... FROM clause of a query against a Delta Lake table.
+
+    This is cached since the same columns are typically selected over and over again.
+
+    Args:
+        table_name (str): name the Delta Lake table is registered under.
+        columns (frozenset[str] | None): columns to select, or None to select all columns.
+
+    Returns:
+        str: The SELECT ... FROM clause of the query.
+    """
+    select_cols = ", ".join(f'"{col}"' for col in sorted(columns)) if columns else "*"
+    return f'SELECT {select_cols} FROM "{table_name}"'
+
+
 def datafusion_predicate_from_filters(
     schema: pa.Schema, filters: DeltaInputFilters | None
 ) -> str | None:
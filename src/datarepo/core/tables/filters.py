@@ -38,13 +38,18 @@ def normalize_filters(filters: InputFilters | None) -> NormalizedFilters:
     We make a special case for the empty filter list, which is treated as no filters.
     Typically, a disjunction of no expressions should be false, but the user likely
     intends to apply no filters, and [] is easier to work with than [[]].
+
+    Lists in the input are reused rather than copied, so callers must copy the result
+    before mutating it.
     """
 
     if filters is None or len(filters) == 0:
         return []
-    elif all(isinstance(f, Filter) for f in filters):
+    elif isinstance(filters[0], Filter):
+        # Checking the first element is enough to tell the two input shapes apart.
+        # Lists are returned as is to avoid a copy on every query.
         filters = cast(Sequence[Filter], filters)
-        return [list(filters)]
+        return [filters if isinstance(filters, list) else list(filters)]
     else:
         filters = cast(Sequence[Sequence[Filter]], filters)
-        return [list(f) for f in filters]
+        return [f if isinstance(f, list) else list(f) for f in filters]
@@ -1,7 +1,8 @@
 # mypy: disable-error-code=override
 
-from os import path
-from typing import Any, Optional, Sequence
+import functools
+import operator
+from typing import Any, Callable, Optional, Sequence
 
 import boto3
 import polars as pl
@@ -40,11 +41,7 @@ def pl_all(exprs: Sequence[pl.Expr]) -> pl.Expr:
     """
     assert len(exprs) > 0
 
-    result = exprs[0]
-    for expr in exprs[1:]:
-        result = result & expr
-
-    return result
+    return functools.reduce(operator.and_, exprs)
 
 
 def pl_any(exprs: Sequence[pl.Expr]) -> pl.Expr:
@@ -58,11 +55,7 @@ def pl_any(exprs: Sequence[pl.Expr]) -> pl.Expr:
     """
     assert len(exprs) > 0
 
-    result = exprs[0]
-    for expr in exprs[1:]:
-        result = result | expr
-
-    return result
+    return functools.reduce(operator.or_, exprs)
 
 
 def _filters_to_conjunction_expr(filters: list[Filter]) -> pl.Expr | None:
@@ -79,10 +72,6 @@ def _filters_to_conjunction_expr(filters: list[Filter]) -> pl.Expr | None:
     if not filters:
         return None
 
-    result = _filter_to_expr(filters[0])
-    for filter in filters[1:]:
-        result = result & _filter_to_expr(filter)
-
     return pl_all([_filter_to_expr(filter) for filter in filters])
 
 
@@ -97,12 +86,32 @@ def _filters_to_expr(filters: NormalizedFilters) -> pl.Expr | None:
         pl.Expr | None: A polars expression that represents the disjunction of all conjunctions of filters,
         or None if there are no filters.
     """
-    conjunctions = [_filters_to_conjunction_expr(filter_set) for filter_set in filters]
-    not_none_conjunctions = [c for c in conjunctions if c is not None]
-    if not not_none_conjunctions:
+    conjunctions = [
+        conjunction
+        for filter_set in filters
+        if (conjunction := _filters_to_conjunction_expr(filter_set)) is not None
+    ]
+    if not conjunctions:
         return None
 
-    return pl_any(not_none_conjunctions)
+    # A single conjunction is returned as is by pl_any, without an OR
+    return pl_any(conjunctions)
+
+
+_FILTER_EXPR_BUILDERS: dict[str, Callable[[pl.Expr, Any], pl.Expr]] = {
+    "=": lambda col, value: col == value,
+    "!=": lambda col, value: col != value,
+    "<": lambda col, value: col < value,
+    ">": lambda col, value: col > value,
+    "<=": lambda col, value: col <= value,
+    ">=": lambda col, value: col >= value,
+    "in": lambda col, value: col.is_in(value),
+    "not in": lambda col, value: ~col.is_in(value),
+    "contains": lambda col, value: col.str.contains(value),
+    "includes": lambda col, value: col.list.contains(value),
+    "includes any": lambda col, value: pl_any([col.list.contains(v) for v in value]),
+    "includes all": lambda col, value: pl_all([col.list.contains(v) for v in value]),
+}
 
 
 def _filter_to_expr(filter: Filter) -> pl.Expr:
@@ -117,37 +126,63 @@ def _filter_to_expr(filter: Filter) -> pl.Expr:
     Returns:
         pl.Expr: A polars expression that represents the filter condition.
     """
-    if filter.operator == "=":
-        return pl.col(filter.column) == filter.value
-    elif filter.operator == "!=":
-        return pl.col(filter.column) != filter.value
-    elif filter.operator == "<":
-        return pl.col(filter.column) < filter.value
-    elif filter.operator == ">":
-        return pl.col(filter.column) > filter.value
-    elif filter.operator == "<=":
-        return pl.col(filter.column) <= filter.value
-    elif filter.operator == ">=":
-        return pl.col(filter.column) >= filter.value
-    elif filter.operator == "in":
-        return pl.col(filter.column).is_in(filter.value)
-    elif filter.operator == "not in":
-        return ~pl.col(filter.column).is_in(filter.value)
-    elif filter.operator == "contains":
-        return pl.col(filter.column).str.contains(filter.value)
-    elif filter.operator == "includes":
-        return pl.col(filter.column).list.contains(filter.value)
-    elif filter.operator == "includes any":
-        return pl_any(
-            [pl.col(filter.column).list.contains(value) for value in filter.value]
-        )
-    elif filter.operator == "includes all":
-        return pl_all(
-            [pl.col(filter.column).list.contains(value) for value in filter.value]
-        )
-    else:
+    build_expr = _FILTER_EXPR_BUILDERS.get(filter.operator)
+    if build_expr is None:
         raise ValueError(f"Unsupported operator {filter.operator}")
 
+    return build_expr(pl.col(filter.column), filter.value)
+
+
+def _index_partition_filters(
+    partitioning: list[Partition], filters: NormalizedFilters
+) -> list[dict[str, list[Filter]]]:
+    """Indexes the partition filters of each filter set by column.
+
+    Args:
+        partitioning (list[Partition]): partitions of the table.
+        filters (NormalizedFilters): filter sets to index.
+
+    Returns:
+        list[dict[str, list[Filter]]]: filters on partition columns of each filter set,
+        indexed by column.
+    """
+    partition_columns = {partition.column for partition in partitioning}
+    filters_by_column: list[dict[str, list[Filter]]] = []
+    for filter_set in filters:
+        by_column: dict[str, list[Filter]] = {}
+        for f in filter_set:
+            if f.column in partition_columns:
+                by_column.setdefault(f.column, []).append(f)
+        filters_by_column.append(by_column)
+    return filters_by_column
+
+
+def _common_equality_filter(
+    partition: Partition, filters_by_column: list[dict[str, list[Filter]]]
+) -> Filter | None:
+    """Returns the equality filter on a partition shared by all filter sets.
+
+    Args:
+        partition (Partition): partition to look up.
+        filters_by_column (list[dict[str, list[Filter]]]): filters of each filter set, indexed by column.
+
+    Returns:
+        Filter | None: the equality filter, or None as soon as one filter set does not have
+        exactly one equality filter on the partition, or has a different one.
+    """
+    common_filter = None
+    for by_column in filters_by_column:
+        partition_filter = exactly_one_equality_filter(
+            partition, by_column.get(partition.column, [])
+        )
+        if partition_filter is None:
+            return None
+        if common_filter is None:
+            common_filter = partition_filter
+        elif partition_filter != common_filter:
+            return None
+    return common_filter
+
 
 class ParquetTable(TableProtocol):
     """A table that is stored in Parquet format."""
@@ -198,6 +233,15 @@ class ParquetTable(TableProtocol):
         self.uri = uri
         self.partitioning = partitioning
         self.partitioning_scheme = partitioning_scheme
+        self._partition_types = {
+            partition.column: partition.col_type for partition in partitioning
+        }
+        # Partitions applied to the URI are always a prefix of the partitioning,
+        # so the hive schema only depends on how many of them were applied.
+        self._hive_schemas = [
+            {partition.column: partition.col_type for partition in partitioning[i:]}
+            for i in range(len(partitioning) + 1)
+        ]
 
         self.table_metadata = TableMetadata(
             table_type="PARQUET",
@@ -209,12 +253,19 @@ class ParquetTable(TableProtocol):
 
         self.parquet_file_name = parquet_file_name
 
+        self._schema_cache: TableSchema | None = None
+
     def get_schema(self) -> TableSchema:
         """Generates the schema of the table, including partitions and columns.
 
+        Resolving the columns scans the table, so the schema is computed once and cached.
+
         Returns:
             TableSchema: table schema containing partitions and columns.
         """
+        if self._schema_cache is not None:
+            return self._schema_cache
+
         partitions = [
             TablePartition(
                 column_name=filter.column,
@@ -239,10 +290,11 @@ class ParquetTable(TableProtocol):
                     filter_only=False,
                     has_stats=False,
                 )
-                for key, type in table.schema.items()
+                for key, type in table.collect_schema().items()
             ]
 
-        return TableSchema(partitions=partitions, columns=columns)
+        self._schema_cache = TableSchema(partitions=partitions, columns=columns)
+        return self._schema_cache
 
     def __call__(
         self,
@@ -279,10 +331,7 @@ class ParquetTable(TableProtocol):
         df = pl.scan_parquet(
             uri,
             hive_partitioning=len(remaining_partitions) > 0,
-            hive_schema={
-                partition.column: partition.col_type
-                for partition in remaining_partitions
-            },
+            hive_schema=self._hive_schemas[len(applied_filters)],
             allow_missing_columns=True,
             storage_options=storage_options,
         )
@@ -290,16 +339,12 @@ class ParquetTable(TableProtocol):
         if applied_filters:
             # Add columns removed from partitions and added to uri
             df = df.with_columns(
-                pl.lit(f.value)
-                .cast(
-                    next(
-                        partition.col_type
-                        for partition in self.partitioning
-                        if partition.column == f.column
-                    )
-                )
-                .alias(f.column)
-                for f in applied_filters
+                [
+                    pl.lit(f.value)
+                    .cast(self._partition_types[f.column])
+                    .alias(f.column)
+                    for f in applied_filters
+                ]
             )
 
         if remaining_filters:
@@ -328,7 +373,8 @@ class ParquetTable(TableProtocol):
                 f"Not enough partitions specified, missing: {partition_names}"
             )
 
-        return path.join(uri_with_prefix, self.parquet_file_name)
+        # the prefix is either empty or ends with a slash
+        return f"{uri_with_prefix}{self.parquet_file_name}"
 
     def _build_uri_from_filters(
         self,
@@ -369,34 +415,20 @@ class ParquetTable(TableProtocol):
         if not filters or not self.partitioning:
             return uri, self.partitioning, filters, []
 
-        partitions = list(self.partitioning)
-        filters = [list(filter_set) for filter_set in filters]
-        applied_filters = []
-
-        for i, partition in enumerate(self.partitioning):
-            partition_filters = [
-                exactly_one_equality_filter(partition, f) for f in filters
-            ]
-
-            if len(partition_filters) == 0:
-                break
-
-            # either 0 or multiple filters for this partition,
-            # break and deal with the s3 list() query
-            if any(partition_filter is None for partition_filter in partition_filters):
-                break
-
-            # Only move forward if all remaining filter sets have the same partition filter
-            if not all(
-                partition_filter == partition_filters[0]
-                for partition_filter in partition_filters
-            ):
-                break
+        # index the partition filters of each filter set by column once,
+        # instead of scanning every filter set again for each partition
+        filters_by_column = _index_partition_filters(self.partitioning, filters)
 
-            partition_filter = partition_filters[0]
+        applied_filters = []
+        uri_components = []
 
+        for partition in self.partitioning:
+            # Stops at the first filter set without exactly one equality filter for
+            # this partition, or with a different one than the other filter sets.
+            # In that case, break and deal with the s3 list() query
+            partition_filter = _common_equality_filter(partition, filters_by_column)
             if partition_filter is None:
-                continue
+                break
 
             if self.partitioning_scheme == PartitioningScheme.DIRECTORY:
                 partition_component = str(partition_filter.value)
@@ -405,20 +437,27 @@ class ParquetTable(TableProtocol):
                     partition.column + "=" + str(partition_filter.value)
                 )
 
-            uri = path.join(uri, partition_component)
-
-            # remove the partition and filter since it's been applied
-            # technically might not need to remove the partitions,
-            # but they are semantically meaningless as we already have
-            # constructed the URI, so we can pop them
-            partitions.remove(partition)
-            for filter_set in filters:
-                filter_set.remove(partition_filter)
-
+            uri_components.append(partition_component)
             applied_filters.append(partition_filter)
 
-        uri = path.join(
-            uri, ""
-        )  # trailing slash prevents inclusion of partitions that are subsets of other partitions
+        # Same result as joining with os.path.join, without its per-call overhead.
+        # The trailing slash prevents inclusion of partitions that are subsets of other partitions
+        if uri and not uri.endswith("/"):
+            uri += "/"
+        for partition_component in uri_components:
+            uri += partition_component + "/"
+
+        # remove the partitions and filters that have been applied.
+        # technically might not need to remove the partitions,
+        # but they are semantically meaningless as we already have
+        # constructed the URI, so we can drop them.
+        # Partitions are applied in order, so the remaining ones are a suffix, and
+        # each applied column has exactly one filter in every filter set.
+        partitions = self.partitioning[len(applied_filters) :]
+        applied_columns = {f.column for f in applied_filters}
+        filters = [
+            [f for f in filter_set if f.column not in applied_columns]
+            for filter_set in filters
+        ]
 
         return (uri, partitions, filters, applied_filters)
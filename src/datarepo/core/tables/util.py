@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, NamedTuple, Optional
+import functools
+from typing import Any, Callable, NamedTuple, Optional
 
 import logging
 import boto3
@@ -13,7 +14,7 @@ from datarepo.core.tables.filters import Filter, NormalizedFilters
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class RoapiOptions:
     use_memory_table: bool = False
     disable: bool = False
@@ -21,7 +22,7 @@ class RoapiOptions:
     reload_interval_seconds: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeltaRoapiOptions(RoapiOptions):
     reload_interval_seconds: int | None = 60
 
@@ -156,9 +157,23 @@ def filters_to_sql_predicate(schema: pa.Schema, filters: NormalizedFilters) -> s
     if not filters:
         return "true"
 
-    return " or ".join(
-        filters_to_sql_conjunction(schema, filter_set) for filter_set in filters
-    )
+    column_types = _column_types(schema)
+    # A conjunction with an empty `in` filter can never match, so it is dropped
+    # instead of being rendered as an invalid `in ()` expression
+    conjunctions = [
+        _filters_to_sql_conjunction(column_types, filter_set)
+        for filter_set in filters
+        if not any(_is_empty_in_filter(f) for f in filter_set)
+    ]
+    if not conjunctions:
+        return "false"
+
+    return " or ".join(conjunctions)
+
+
+def _is_empty_in_filter(f: Filter) -> bool:
+    """Checks whether the filter is an `in` filter without any values."""
+    return f.operator == "in" and isinstance(f.value, list | tuple) and not f.value
 
 
 def filters_to_sql_conjunction(schema: pa.Schema, filters: list[Filter]) -> str:
@@ -171,12 +186,7 @@ def filters_to_sql_conjunction(schema: pa.Schema, filters: list[Filter]) -> str:
     Returns:
         str: _description_
     """
-    if not filters:
-        return "true"
-
-    exprs = (filter_to_sql_expr(schema, f) for f in filters)
-    conjunction_expr = " and ".join(exprs)
-    return f"({conjunction_expr})"
+    return _filters_to_sql_conjunction(_column_types(schema), filters)
 
 
 def filter_to_sql_expr(schema: pa.Schema, f: Filter) -> str:
@@ -193,54 +203,82 @@ def filter_to_sql_expr(schema: pa.Schema, f: Filter) -> str:
     Returns:
         str: SQL expression representing the filter.
     """
-    column = f.column
-    if column not in schema.names:
-        raise ValueError(f"Invalid column name {column}")
-
-    column_type = schema.field(column).type
-    if f.operator in (
-        "=",
-        "!=",
-        "<",
-        "<=",
-        ">",
-        ">=",
-        "in",
-        "not in",
-    ):
+    return _filter_to_sql_expr(_column_types(schema), f)
+
+
+def _column_types(schema: pa.Schema) -> dict[str, pa.DataType]:
+    """Map the column names of a schema to their types, for O(1) lookups."""
+    return {field.name: field.type for field in schema}
+
+
+def _filters_to_sql_conjunction(
+    column_types: dict[str, pa.DataType], filters: list[Filter]
+) -> str:
+    """Same as `filters_to_sql_conjunction`, with the schema already resolved to column types."""
+    if not filters:
+        return "true"
+
+    exprs = [_filter_to_sql_expr(column_types, f) for f in filters]
+    conjunction_expr = " and ".join(exprs)
+    return f"({conjunction_expr})"
+
+
+def _filter_to_sql_expr(column_types: dict[str, pa.DataType], f: Filter) -> str:
+    """Same as `filter_to_sql_expr`, with the schema already resolved to column types."""
+    column_type = column_types.get(f.column)
+    if column_type is None:
+        raise ValueError(f"Invalid column name {f.column}")
+
+    if f.operator in _SQL_COMPARISON_OPERATORS:
         value_str = value_to_sql_expr(f.value, column_type)
-        return f"({column} {f.operator} {value_str})"
+        return f"({f.column} {f.operator} {value_str})"
 
-    elif f.operator == "contains":
-        assert isinstance(f.value, str)
-        escaped_str = escape_str_for_sql(f.value)
-        like_str = f"'%{escaped_str}%'"
-        return f"({column} like {like_str})"
+    build_expr = _SQL_EXPR_BUILDERS.get(f.operator)
+    if build_expr is None:
+        raise ValueError(f"Invalid operator {f.operator}")
 
-    elif f.operator in ("includes", "includes any", "includes all"):
-        assert pa.types.is_list(column_type) or pa.types.is_large_list(column_type)
+    return build_expr(f, column_type)
 
-        values: list[Any]
-        if f.operator == "includes":
-            values = [f.value]
-        else:
-            assert isinstance(f.value, list | tuple)
-            values = list(f.value)
 
-        # NOTE: for includes any/all, we join multiple array_contains with or/and
-        value_exprs = (
-            value_to_sql_expr(value, column_type.value_type) for value in values
-        )
-        include_exprs = (
-            f"array_contains({column}, {value_expr})" for value_expr in value_exprs
-        )
-        join_operator = " or " if f.operator == "includes any" else " and "
-        conjunction_expr = join_operator.join(include_exprs)
+def _contains_to_sql_expr(f: Filter, column_type: pa.DataType) -> str:
+    """Convert a `contains` filter to a SQL `like` expression."""
+    assert isinstance(f.value, str)
+    escaped_str = escape_str_for_sql(f.value)
+    like_str = f"'%{escaped_str}%'"
+    return f"({f.column} like {like_str})"
 
-        return f"({conjunction_expr})"
 
+def _includes_to_sql_expr(f: Filter, column_type: pa.DataType) -> str:
+    """Convert an `includes`, `includes any` or `includes all` filter to SQL `array_contains` expressions."""
+    assert pa.types.is_list(column_type) or pa.types.is_large_list(column_type)
+
+    values: list[Any]
+    if f.operator == "includes":
+        values = [f.value]
     else:
-        raise ValueError(f"Invalid operator {f.operator}")
+        assert isinstance(f.value, list | tuple)
+        values = list(f.value)
+
+    # NOTE: for includes any/all, we join multiple array_contains with or/and
+    format_value = _sql_value_formatter(column_type.value_type)
+    include_exprs = [
+        f"array_contains({f.column}, {format_value(value)})" for value in values
+    ]
+    join_operator = " or " if f.operator == "includes any" else " and "
+    conjunction_expr = join_operator.join(include_exprs)
+
+    return f"({conjunction_expr})"
+
+
+# Operators that translate directly to a SQL binary expression
+_SQL_COMPARISON_OPERATORS = frozenset(("=", "!=", "<", "<=", ">", ">=", "in", "not in"))
+
+_SQL_EXPR_BUILDERS: dict[str, Callable[[Filter, pa.DataType], str]] = {
+    "contains": _contains_to_sql_expr,
+    "includes": _includes_to_sql_expr,
+    "includes any": _includes_to_sql_expr,
+    "includes all": _includes_to_sql_expr,
+}
 
 
 def value_to_sql_expr(value: Any, value_type: pa.DataType) -> str:
@@ -253,22 +291,45 @@ def value_to_sql_expr(value: Any, value_type: pa.DataType) -> str:
     Returns:
         str: SQL expression string representing the value.
     """
-    if isinstance(value, list | tuple):
-        elements_str = ", ".join(
-            value_to_sql_expr(element, value_type) for element in value
-        )
-        value_str = f"({elements_str})"
-    else:
-        value_str = str(value)
+    return _sql_value_formatter(value_type)(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _sql_value_formatter(value_type: pa.DataType) -> Callable[[Any], str]:
+    """Build a function that converts values of the given type to SQL expression strings.
+
+    The type checks are resolved once per type, instead of once per value, which matters
+    for filters with long lists of values.
+
+    Args:
+        value_type (pa.DataType): value type, used to determine how to format the values.
+
+    Returns:
+        Callable[[Any], str]: A function converting a value, or a list of values, to a SQL expression string.
+    """
+    format_scalar: Callable[[Any], str]
+    if pa.types.is_string(value_type):
         # Escape the string so the user doesn't need to filter like ("col", "=", "'value'")
-        if pa.types.is_string(value_type):
-            escaped_str = escape_str_for_sql(value_str)
-            value_str = f"'{escaped_str}'"
-    return value_str
+        def format_scalar(value: Any) -> str:
+            return f"'{escape_str_for_sql(str(value))}'"
+
+    else:
+        format_scalar = str
+
+    def format_value(value: Any) -> str:
+        if isinstance(value, list | tuple):
+            elements_str = ", ".join([format_value(element) for element in value])
+            return f"({elements_str})"
+        return format_scalar(value)
+
+    return format_value
 
 
 def escape_str_for_sql(value: str) -> str:
     """Escape a string for use in a SQL query."""
+    # Most values have no quotes, and a membership test is cheaper than replace()
+    if "'" not in value:
+        return value
     return value.replace("'", "''")
 
 
@@ -292,7 +353,7 @@ def format_value_for_sql(value: Any) -> str:
     elif isinstance(value, (int, float)):
         return str(value)
     elif isinstance(value, (list, tuple)):
-        return ", ".join(format_value_for_sql(v) for v in value)
+        return ", ".join([format_value_for_sql(v) for v in value])
     else:
         # For other types, convert to string and treat as string
         escaped = str(value).replace("'", "''")
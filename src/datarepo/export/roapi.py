@@ -125,9 +125,10 @@ def _export_parquet_table(name: str, table: ParquetTable) -> dict[str, Any] | No
         },
         "partition_columns": partition_cols,
         "schema_from_files": [schema_from_file],
+        **_reload_interval_entry(roapi_opts),
     }
 
-    return _with_reload_interval(table_config, roapi_opts)
+    return table_config
 
 
 def _export_deltalake_table(name: str, table: DeltalakeTable) -> dict[str, Any] | None:
@@ -153,9 +154,10 @@ def _export_deltalake_table(name: str, table: DeltalakeTable) -> dict[str, Any]
             "format": "delta",
             "use_memory_table": roapi_opts.use_memory_table,
         },
+        **_reload_interval_entry(roapi_opts),
     }
 
-    return _with_reload_interval(table_config, roapi_opts)
+    return table_config
 
 
 def _export_clickhouse_table(
@@ -186,36 +188,35 @@ def _export_clickhouse_table(
             "use_memory_table": roapi_opts.use_memory_table,
             "table": table.name,
         },
+        **_reload_interval_entry(roapi_opts),
     }
 
-    return _with_reload_interval(table_config, roapi_opts)
+    return table_config
 
 
-def _with_reload_interval(
-    table_config: dict[str, Any], roapi_opts: RoapiOptions
-) -> dict[str, Any]:
-    """Adds a reload interval to the table configuration if specified.
+def _reload_interval_entry(roapi_opts: RoapiOptions) -> dict[str, Any]:
+    """Builds the reload interval entry of a table configuration.
 
     Args:
-        table_config (dict[str, Any]): table configuration to modify.
         roapi_opts (RoapiOptions): options that may include a reload interval.
 
     Returns:
-        dict[str, Any]: modified table configuration with reload interval if specified.
+        dict[str, Any]: the reload interval entry to merge into the table configuration,
+        or an empty dictionary if no reload interval is specified.
     """
-    if roapi_opts.reload_interval_seconds is not None:
-        table_config["reload_interval"] = {
-            "secs": roapi_opts.reload_interval_seconds,
-            "nanos": 0,
-        }
-    return table_config
+    if roapi_opts.reload_interval_seconds is None:
+        return {}
+    return {"reload_interval": {"secs": roapi_opts.reload_interval_seconds, "nanos": 0}}
+
+
+_PY_TYPE_TO_ROAPI: dict[type, str] = {
+    int: "Int64",
+    str: "Utf8",
+    bool: "Boolean",
+    float: "Float64",
+}
 
 
 def py_type_to_roapi(py_type: type) -> str:
     """Maps Python types to Roapi data types."""
-    return {
-        int: "Int64",
-        str: "Utf8",
-        bool: "Boolean",
-        float: "Float64",
-    }[py_type]
+    return _PY_TYPE_TO_ROAPI[py_type]
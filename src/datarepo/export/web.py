@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from datarepo.core.catalog.catalog import Catalog, Database
 from datarepo.core.tables.deltalake_table import DeltalakeTable
 from datarepo.core.tables.metadata import TableProtocol
@@ -10,11 +11,17 @@ import sys
 import logging
 import shutil
 import importlib.resources
+from operator import itemgetter
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stderr)
 logger = logging.getLogger(__name__)
 
+COPY_MAX_WORKERS = 8
+
+# Static site files built at package build time, copied next to the exported data
+PRECOMPILED_SITE_DIR = Path(__file__).parent / "static_site" / "precompiled"
+
 
 def export_table(name: str, table: TableProtocol):
     """Export a table to a dictionary format suitable for web catalog generation.
@@ -46,20 +53,29 @@ def export_table(name: str, table: TableProtocol):
     }
 
 
-def export_database(name: str, database: Database):
+def export_database(name: str, database: Database, max_workers: int = 1):
     """Export a database to a dictionary format suitable for web catalog generation.
 
+    Resolving a table schema is mostly IO (e.g. listing S3), so tables can be exported
+    in parallel with max_workers > 1. This calls get_schema of several tables at once,
+    including the functions of function tables, so it should only be used when all
+    tables of the database are safe to use from multiple threads.
+
     Args:
         name (str): name of the database, used as the key in the catalog.
         database (Database): Database to export.
+        max_workers (int, optional): maximum number of tables exported concurrently. Defaults to 1.
 
     Returns:
         dict[str, Any]: A dictionary representing the database's metadata,
     """
-    tables = []
+    items = sorted(database.get_tables().items(), key=itemgetter(0))
 
-    for key, table in sorted(database.get_tables().items()):
-        tables.append(export_table(key, table))
+    if max_workers > 1 and len(items) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            tables = list(executor.map(lambda item: export_table(*item), items))
+    else:
+        tables = [export_table(key, table) for key, table in items]
 
     return {
         "name": name,
@@ -83,12 +99,13 @@ def export_catalog_metadata(catalog: Catalog):
     }
 
 
-def export_catalog(name: str, catalog: Catalog):
+def export_catalog(name: str, catalog: Catalog, max_workers: int = 1):
     """Export a catalog to a dictionary format suitable for web catalog generation.
 
     Args:
         name (str): name of the catalog, used as the key in the export.
         catalog (Catalog): Catalog to export.
+        max_workers (int, optional): maximum number of tables of a database exported concurrently. Defaults to 1.
 
     Returns:
         dict[str, Any]: A dictionary representing the catalog's metadata,
@@ -97,26 +114,35 @@ def export_catalog(name: str, catalog: Catalog):
     return {
         "name": name,
         "metadata": export_catalog_metadata(catalog),
-        "databases": [export_database(key, catalog.db(key)) for key in catalog.dbs()],
+        "databases": [
+            export_database(key, catalog.db(key), max_workers=max_workers)
+            for key in catalog.dbs()
+        ],
     }
 
 
-def export_datarepo(catalogs: list[tuple[str, Catalog]]) -> dict:
+def export_datarepo(catalogs: list[tuple[str, Catalog]], max_workers: int = 1) -> dict:
     """Export the datarepo catalogs to a dictionary format.
 
     Args:
         catalogs (list[tuple[str, Catalog]]): List of tuples containing catalog names and their corresponding Catalog objects.
+        max_workers (int, optional): maximum number of tables of a database exported concurrently. Defaults to 1.
 
     Returns:
         dict: A dictionary containing a list of exported catalogs, each represented as a dictionary.
     """
     return {
-        "catalogs": [export_catalog(name, catalog) for name, catalog in catalogs],
+        "catalogs": [
+            export_catalog(name, catalog, max_workers=max_workers)
+            for name, catalog in catalogs
+        ],
     }
 
 
 def export_and_generate_site(
-    catalogs: list[tuple[str, Catalog]], output_dir: str = "./dist"
+    catalogs: list[tuple[str, Catalog]],
+    output_dir: str = "./dist",
+    max_workers: int = 1,
 ):
     """
     Export the catalog to a JSON file and copy the precompiled static site files.
@@ -124,9 +150,11 @@ def export_and_generate_site(
     Args:
         catalogs: List of (name, catalog) tuples to export
         output_dir: Directory where the static site will be generated (default: "./dist")
+        max_workers: Maximum number of tables of a database exported concurrently, only
+            for tables that are safe to use from multiple threads (default: 1)
     """
     # Export catalog to a JSON file
-    catalog_data = export_datarepo(catalogs)
+    catalog_data = export_datarepo(catalogs, max_workers=max_workers)
 
     output_path = Path(output_dir)
     # Remove output directory if it exists to ensure idempotency
@@ -134,16 +162,47 @@ def export_and_generate_site(
         shutil.rmtree(output_path)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path / "data.json", "w") as f:
-        json.dump(catalog_data, f)
-
-    project_root = Path(__file__).parent
-    precompiled_dir = project_root / "static_site" / "precompiled"
-
-    logger.info(f"Copying precompiled directory {precompiled_dir} to {output_path}")
-    if not precompiled_dir.exists():
+    # json.dumps encodes the whole document in C and writes it once, while json.dump
+    # issues a write per encoded chunk. The file is only read by the site, so it is
+    # written compact and as UTF-8 rather than escaped ASCII.
+    (output_path / "data.json").write_text(
+        json.dumps(catalog_data, separators=(",", ":"), ensure_ascii=False),
+        encoding="utf-8",
+    )
+
+    logger.info(
+        f"Copying precompiled directory {PRECOMPILED_SITE_DIR} to {output_path}"
+    )
+    if not PRECOMPILED_SITE_DIR.exists():
         raise FileNotFoundError(
             f"Could not find precompiled directory. Make sure you're running from the project root or the package is properly installed."
         )
 
-    shutil.copytree(precompiled_dir, output_path, dirs_exist_ok=True)
+    _copy_tree_parallel(PRECOMPILED_SITE_DIR, output_path)
+
+
+def _copy_tree_parallel(src: Path, dst: Path) -> None:
+    """Copy a directory tree, copying the files concurrently.
+
+    The precompiled site is many small files, so a sequential copy is dominated by
+    per-file syscall latency. Files are copied rather than hard linked so that edits
+    to the generated site never modify the installed package.
+
+    Args:
+        src (Path): directory to copy.
+        dst (Path): destination directory, created if needed.
+    """
+    sources = []
+    destinations = []
+    for source in src.rglob("*"):
+        destination = dst / source.relative_to(src)
+        if source.is_dir():
+            destination.mkdir(parents=True, exist_ok=True)
+        else:
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            sources.append(source)
+            destinations.append(destination)
+
+    with ThreadPoolExecutor(max_workers=COPY_MAX_WORKERS) as executor:
+        # consume the results so that copy errors are raised
+        list(executor.map(shutil.copy2, sources, destinations))
@@ -1,5 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import dataclasses
+from datetime import date
 import os
 from pathlib import Path
+import threading
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -146,6 +150,20 @@ class TestDeltalakeTable:
             )
         )
 
+    def test_fetch_dfs_by_paths_keeps_file_order(self, mock_pl_read_parquet):
+        result = fetch_dfs_by_paths(
+            ["df-ab2.parquet", "df-ab.parquet"],
+            schema=pa.schema(
+                [
+                    ("a", pa.int64()),
+                    ("b", pa.string()),
+                ]
+            ),
+        )
+
+        # Rows should be in the order of the given files, regardless of read completion order
+        assert result["a"].to_list() == [4, 5, 6, 1, 2, 3]
+
     def test_fetch_dfs_by_paths_reordered(self, mock_pl_read_parquet):
         result = fetch_dfs_by_paths(
             # One parquet has columns in a different order, but we should use schema's order
@@ -377,6 +395,170 @@ class TestDeltalakeTable:
         expected_sorted = expected.sort("value")
         assert actual_sorted.equals(expected_sorted)
 
+    def test_call_with_date_string_literal_filter(self, tmp_path: Path):
+        # SQL string filters may compare typed columns against string literals
+        table = DeltalakeTable(
+            name="my_dated_table",
+            schema=pa.schema(
+                [
+                    ("implant_id", pa.int64()),
+                    ("date", pa.date32()),
+                    ("value", pa.int64()),
+                ]
+            ),
+            uri=str(tmp_path / "test-dated-table"),
+        )
+        delta_table = DeltaTable.create(
+            table_uri=table.uri, schema=table.schema, partition_by=["implant_id"]
+        )
+        write_deltalake(
+            delta_table,
+            data=pa.table(
+                {
+                    "implant_id": [1, 1, 1, 2],
+                    "date": [
+                        date(2024, 1, 1),
+                        date(2024, 1, 2),
+                        date(2024, 1, 3),
+                        date(2024, 1, 2),
+                    ],
+                    "value": [1, 2, 3, 4],
+                },
+                schema=table.schema,
+            ),
+            mode="append",
+        )
+
+        result = table(filters="implant_id = 1 and date >= '2024-01-02'").collect()
+        assert sorted(result["value"].to_list()) == [2, 3]
+
+    def test_delta_table_is_reused(
+        self, delta_table_definition: DeltalakeTable, delta_table: DeltaTable
+    ):
+        dt = delta_table_definition._cached_delta_table()
+        assert dt.version() == 0
+
+        write_deltalake(
+            delta_table,
+            data=pl.DataFrame(
+                {
+                    "implant_id": [1],
+                    "date": ["2024-01-01"],
+                    "uniq": ["a"],
+                    "value": [1],
+                }
+            ).to_arrow(),
+            mode="append",
+        )
+
+        # The cached table is reused, but brought up to date with the new commit
+        assert delta_table_definition._cached_delta_table() is dt
+        assert dt.version() == 1
+
+        # Pinned versions are cached separately
+        assert delta_table_definition._cached_delta_table(version=0).version() == 0
+
+    def test_delta_table_is_not_shared_with_reads(
+        self, delta_table_definition: DeltalakeTable, delta_table: DeltaTable
+    ):
+        write_deltalake(
+            delta_table,
+            data=pl.DataFrame(
+                {
+                    "implant_id": [1],
+                    "date": ["2024-01-01"],
+                    "uniq": ["a"],
+                    "value": [1],
+                }
+            ).to_arrow(),
+            mode="append",
+        )
+        rows = delta_table_definition().collect().height
+
+        dt = delta_table_definition.delta_table()
+        assert dt is not delta_table_definition.delta_table()
+
+        # Moving a caller's table to another version does not affect later reads
+        dt.load_as_version(0)
+        assert delta_table_definition().collect().height == rows
+
+    def test_sql_predicate_is_cached(self, delta_table_definition: DeltalakeTable):
+        filters = [Filter("implant_id", "in", [1, 2]), Filter("uniq", "=", "a")]
+
+        predicate = delta_table_definition._sql_predicate(filters)
+        assert predicate == "((implant_id in (1, 2)) and (uniq = 'a'))"
+        assert len(delta_table_definition._sql_predicate_cache) == 1
+
+        assert delta_table_definition._sql_predicate(list(filters)) == predicate
+        assert len(delta_table_definition._sql_predicate_cache) == 1
+
+        # Values that compare equal but render differently should not share an entry
+        assert (
+            delta_table_definition._sql_predicate([Filter("value", "=", True)])
+            == "((value = True))"
+        )
+        assert (
+            delta_table_definition._sql_predicate([Filter("value", "=", 1)])
+            == "((value = 1))"
+        )
+
+    def test_sql_predicate_cache_is_thread_safe(
+        self, delta_table_definition: DeltalakeTable, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(
+            "datarepo.core.tables.deltalake_table.SQL_PREDICATE_CACHE_SIZE", 1
+        )
+        evicting = threading.Event()
+        resume = threading.Event()
+
+        class PausingDict(dict):
+            def __delitem__(self, key):
+                # Pause the first eviction, so that another thread can try to evict
+                # the same oldest entry in the meantime
+                if not evicting.is_set():
+                    evicting.set()
+                    resume.wait(timeout=5)
+                super().__delitem__(key)
+
+        delta_table_definition._sql_predicate_cache = PausingDict()
+        delta_table_definition._sql_predicate([Filter("value", "=", 0)])
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(
+                delta_table_definition._sql_predicate, [Filter("value", "=", 1)]
+            )
+            assert evicting.wait(timeout=5)
+            second = executor.submit(
+                delta_table_definition._sql_predicate, [Filter("value", "=", 2)]
+            )
+            with pytest.raises(FutureTimeoutError):
+                # The second eviction waits for the first one to finish
+                second.result(timeout=0.2)
+            resume.set()
+
+            assert first.result() == "((value = 1))"
+            assert second.result() == "((value = 2))"
+
+        assert len(delta_table_definition._sql_predicate_cache) == 1
+
+    def test_cache_options(self):
+        cache_options = DeltaCacheOptions(
+            file_cache_path="~/delta-cache",
+            file_cache_last_checkpoint_valid_duration="30m",
+        )
+
+        assert cache_options.to_storage_options() == {
+            "file_cache_path": os.path.expanduser("~/delta-cache"),
+            "file_cache_last_checkpoint_valid_duration": "30m",
+        }
+        # The derived storage options are not part of the dataclass fields
+        assert dataclasses.asdict(cache_options) == {
+            "file_cache_path": "~/delta-cache",
+            "file_cache_last_checkpoint_valid_duration": "30m",
+        }
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            cache_options.file_cache_path = "/tmp/other-cache"  # type: ignore[misc]
+
     """ this test is commented out until we upstream delta caching
     def test_delta_cache(
         self,
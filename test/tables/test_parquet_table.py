@@ -106,6 +106,15 @@ class TestParquetTable:
                 [Filter("value", ">=", 20)],
                 pl.DataFrame({"implant_id": [2, 3], "value": [20, 30]}),
             ),
+            # Long value lists
+            (
+                [Filter("value", "in", list(range(0, 100, 10)))],
+                pl.DataFrame({"implant_id": [1, 2, 3], "value": [10, 20, 30]}),
+            ),
+            (
+                [Filter("value", "not in", list(range(0, 100, 20)))],
+                pl.DataFrame({"implant_id": [1, 3], "value": [10, 30]}),
+            ),
         ],
     )
     def test_read(
@@ -338,6 +347,15 @@ class TestParquetTable:
             result.sort("value").select(expected.columns).equals(expected.sort("value"))
         )
 
+    def test_schema_is_cached(self, parquet_table: ParquetTable):
+        schema = parquet_table.get_schema()
+
+        assert [column["column"] for column in schema.columns] == [
+            "implant_id",
+            "value",
+        ]
+        assert parquet_table.get_schema() is schema
+
     @pytest.mark.parametrize(
         ("filters", "expected"),
         [
@@ -1,5 +1,7 @@
+import polars as pl
 import pyarrow as pa
 
+from datarepo.core.tables.decorator import table
 from datarepo.core.tables.util import (
     Filter,
     Partition,
@@ -66,3 +68,30 @@ class TestTable:
         res = exactly_one_equality_filter(p, [])  # type: ignore
 
         assert res is None
+
+    def test_function_table_filters_kwargs(self):
+        @table
+        def my_table(a: int) -> pl.LazyFrame:
+            return pl.LazyFrame({"a": [a]})
+
+        @table
+        def my_table_var_kwargs(**kwargs) -> pl.LazyFrame:
+            return pl.LazyFrame({key: [value] for key, value in kwargs.items()})
+
+        # Unknown kwargs are dropped unless the function accepts **kwargs
+        assert my_table(a=1, b=2).collect().columns == ["a"]
+        assert my_table_var_kwargs(a=1, b=2).collect().columns == ["a", "b"]
+
+    def test_function_table_schema_is_cached(self):
+        calls = []
+
+        @table
+        def my_table() -> pl.LazyFrame:
+            calls.append(1)
+            return pl.LazyFrame({"a": [1]})
+
+        schema = my_table.get_schema()
+
+        assert [column["column"] for column in schema.columns] == ["a"]
+        assert my_table.get_schema() is schema
+        assert len(calls) == 1
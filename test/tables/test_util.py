@@ -98,6 +98,16 @@ class TestUtil:
                 ],
                 "((str_col = 'x')) or ((int_col = 123) and (int_col < 456))",
             ),
+            (test_schema, [], "true"),
+            (
+                test_schema,
+                [
+                    [Filter("str_col", "=", "x"), Filter("int_col", "in", [])],
+                    [Filter("int_col", "=", 123)],
+                ],
+                "((int_col = 123))",
+            ),
+            (test_schema, [[Filter("int_col", "in", ())]], "false"),
         ],
     )
     def test_filters_to_sql_predicate(
@@ -1,11 +1,17 @@
 # type: ignore
+import importlib
+from pathlib import Path
+import sys
+import tempfile
+from types import ModuleType
 import unittest
 from unittest.mock import ANY, patch
 
+import polars as pl
 from polars import testing as pl_testing
 import pytest
 
-from datarepo.core import ModuleDatabase
+from datarepo.core import ModuleDatabase, table
 from datarepo.core.catalog import Catalog
 from test.data import database, database2
 from test.data.database2 import frame3
@@ -13,13 +19,15 @@ from test.data.database import frame1, frame2
 
 
 class TestCore(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        # The catalog is never mutated by the tests, so it is shared between them
         dbs = {
             "database": ModuleDatabase(database),
             "database2": ModuleDatabase(database2),
         }
 
-        self.catalog = Catalog(dbs)
+        cls.catalog = Catalog(dbs)
 
     def test_get_dbs(self):
         assert self.catalog.dbs() == ["database", "database2"]
@@ -91,3 +99,84 @@ class TestCore(unittest.TestCase):
             warn_patch.assert_called_once_with(ANY, DeprecationWarning)
 
             pl_testing.assert_frame_equal(frame, frame1)
+
+    def test_get_tables_picks_up_module_changes(self):
+        module = ModuleType("dynamic_database")
+        module.new_table = database.new_table
+        db = ModuleDatabase(module)
+
+        assert db.tables() == ["new_table"]
+
+        @table
+        def added_table():
+            return frame2
+
+        module.added_table = added_table
+
+        assert db.tables() == ["added_table", "new_table"]
+        assert db.get_tables()["added_table"] is added_table
+
+    def test_get_tables_picks_up_reassigned_attributes(self):
+        module = ModuleType("dynamic_database")
+        module.new_table = database.new_table
+        db = ModuleDatabase(module)
+
+        assert db.tables() == ["new_table"]
+
+        # Reassigning an attribute keeps the module's size unchanged
+        module.new_table = database.deprecated_table
+
+        assert db.tables() == []
+        assert db.get_tables(show_deprecated=True) == {
+            "new_table": database.deprecated_table
+        }
+
+    def test_get_tables_picks_up_module_reload(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            module_path = Path(tmp_dir) / "reloaded_database.py"
+            module_path.write_text(
+                "from datarepo.core import table\n"
+                "\n"
+                "@table\n"
+                "def my_table():\n"
+                "    return None\n"
+            )
+            sys.path.insert(0, tmp_dir)
+            try:
+                module = importlib.import_module("reloaded_database")
+                db = ModuleDatabase(module)
+                original_table = db.get_tables()["my_table"]
+
+                module_path.write_text(
+                    "from datarepo.core import table\n"
+                    "\n"
+                    "@table(is_deprecated=True)\n"
+                    "def my_table():\n"
+                    "    return None\n"
+                )
+                importlib.invalidate_caches()
+                importlib.reload(module)
+
+                assert db.tables() == []
+                reloaded_table = db.get_tables(show_deprecated=True)["my_table"]
+                assert reloaded_table is not original_table
+            finally:
+                sys.path.remove(tmp_dir)
+                sys.modules.pop("reloaded_database", None)
+
+    def test_global_args(self):
+        @table
+        def args_table(a=None, b=None):
+            return frame1.with_columns(a=pl.lit(a), b=pl.lit(b))
+
+        module = ModuleType("dynamic_database")
+        module.args_table = args_table
+        catalog = Catalog({"db": ModuleDatabase(module)})
+        catalog.set_global_args({"a": 1, "b": 2})
+
+        frame = catalog.db("db").table("args_table").collect()
+        assert frame.row(0) == (1, 2)
+
+        # Call arguments take precedence over global arguments
+        frame = catalog.db("db").table("args_table", b=3).collect()
+        assert frame.row(0) == (1, 3)
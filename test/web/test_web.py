@@ -0,0 +1,31 @@
+import unittest
+from types import ModuleType
+
+from datarepo.core import ModuleDatabase, NlkDataFrame, table
+from datarepo.export.web import export_database
+
+
+def _make_table(size: int):
+    @table
+    def function_table() -> NlkDataFrame:
+        return NlkDataFrame({f"col_{i}": [i] for i in range(size)})
+
+    return function_table
+
+
+class TestWebExport(unittest.TestCase):
+    def setUp(self):
+        module = ModuleType("web_database")
+        for size in range(1, 9):
+            setattr(module, f"table_{size}", _make_table(size))
+
+        self.database = ModuleDatabase(module)
+
+    def test_export_database_concurrently(self):
+        sequential = export_database("database", self.database)
+        concurrent = export_database("database", self.database, max_workers=4)
+
+        assert [t["name"] for t in sequential["tables"]] == [
+            f"table_{size}" for size in range(1, 9)
+        ]
+        assert concurrent == sequential